@@ -25,6 +25,7 @@ from __future__ import annotations
 
 from gemseo import generate_xdsm
 from matplotlib import pyplot as plt
+from numpy import column_stack
 
 from gemseo_fmu.disciplines.fmu_discipline import FMUDiscipline
 from gemseo_fmu.disciplines.time_stepping_system import TimeSteppingSystem
@@ -88,21 +89,29 @@ reference.execute()
 # to that of the complete system.
 
 fig, (ax1, ax2) = plt.subplots(2, 1)
-time_1 = system.local_data["MassSpringSubSystem1:time"]
-time_2 = system.local_data["MassSpringSubSystem2:time"]
-ax1.plot(time_1, system.local_data["x1"], label="x1", color="red")
-ax1.plot(time_2, system.local_data["x2"], label="x2", color="blue")
-ax2.plot(time_1, system.local_data["v1"], label="v1", color="red")
-ax2.plot(time_2, system.local_data["v2"], label="v2", color="blue")
+ax1.set_prop_cycle(color=["red", "blue"])
+ax2.set_prop_cycle(color=["red", "blue"])
+data = system.local_data
+time_1 = data["MassSpringSubSystem1:time"]
+time_2 = data["MassSpringSubSystem2:time"]
+ax1.plot(time_1, data["x1"], label="x1")
+ax1.plot(time_2, data["x2"], label="x2")
+ax2.plot(time_1, data["v1"], label="v1")
+ax2.plot(time_2, data["v2"], label="v2")
 
-time = reference.local_data["MassSpringSystem:time"]
-ax1.plot(time, reference.local_data["x1"], label="x1[ref]", linestyle="--", color="red")
+data = reference.local_data
+time = data["MassSpringSystem:time"]
 ax1.plot(
-    time, reference.local_data["x2"], label="x2[ref]", linestyle="--", color="blue"
+    time,
+    column_stack((data["x1"], data["x2"])),
+    label=["x1[ref]", "x2[ref]"],
+    linestyle="--",
 )
-ax2.plot(time, reference.local_data["v1"], label="v1[ref]", linestyle="--", color="red")
 ax2.plot(
-    time, reference.local_data["v2"], label="v2[ref]", linestyle="--", color="blue"
+    time,
+    column_stack((data["v1"], data["v2"])),
+    label=["v1[ref]", "v2[ref]"],
+    linestyle="--",
 )
 
 ax1.set_xlabel("Time (s)")
@@ -24,6 +24,8 @@ by manually advancing one step at a time.
 from __future__ import annotations
 
 from matplotlib import pyplot as plt
+from numpy import arange
+from numpy import empty
 
 from gemseo_fmu.disciplines.do_step_fmu_discipline import DoStepFMUDiscipline
 from gemseo_fmu.problems.fmu_files import get_fmu_file_path
@@ -49,17 +51,21 @@ discipline = DoStepFMUDiscipline(
 
 # %%
 # Then,
-# we execute the discipline 10 times
-# and create the graph as we go along with different point colors.
+# we execute the discipline 10 times,
+# store the time and output values as we go along
+# and create the graph with different point colors.
 # In that case,
 # executing the discipline 10 times
 # means that we are advancing 10 times by one time step.
-for _ in range(10):
+n_steps = 10
+time = empty(n_steps)
+y = empty(n_steps)
+for i in range(n_steps):
     discipline.execute()
-    plt.scatter(
-        discipline.time,
-        discipline.local_data["y"],
-    )
+    time[i] = discipline.time[0]
+    y[i] = discipline.local_data["y"][0]
+
+plt.scatter(time, y, c=arange(n_steps), cmap="tab10")
 plt.xlabel("Time [s]")
 plt.ylabel("Amplitude [m]")
 plt.show()
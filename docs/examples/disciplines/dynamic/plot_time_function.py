@@ -23,6 +23,7 @@ can be set with time functions.
 from __future__ import annotations
 
 from matplotlib import pyplot as plt
+from numpy import column_stack
 
 from gemseo_fmu.disciplines.dynamic_fmu_discipline import DynamicFMUDiscipline
 from gemseo_fmu.problems.fmu_files import get_fmu_file_path
@@ -66,8 +67,11 @@ discipline.execute({"mass.m": lambda t: 4 - 3 * t})
 # Lastly,
 # we use a chart to compare the positions of the mass:
 fig, (ax1, ax2) = plt.subplots(2, 1, sharex=True)
-ax1.plot(discipline.time, default_y_evolution, label="Default")
-p = ax1.plot(discipline.time, discipline.local_data["y"], label="Custom")
+lines = ax1.plot(
+    discipline.time,
+    column_stack((default_y_evolution, discipline.local_data["y"])),
+    label=["Default", "Custom"],
+)
 ax1.set_ylabel("Amplitude [m]")
 ax1.legend()
 ax2.axhline(default_mass, label="Default")
@@ -75,9 +79,9 @@ ax2.plot(
     discipline.time,
     discipline.local_data["mass.m"],
     label="Custom",
-    color=p[0].get_color(),
+    color=lines[1].get_color(),
 )
 ax2.set_ylabel("Mass [kg]")
-plt.xlabel("Time [s]")
+ax2.set_xlabel("Time [s]")
 ax2.legend()
 plt.show()
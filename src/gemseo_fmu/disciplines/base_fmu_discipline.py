@@ -17,13 +17,15 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from copy import copy
+from functools import lru_cache
 from pathlib import Path
 from shutil import rmtree
+from threading import RLock
 from types import MappingProxyType
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import Callable
 from typing import ClassVar
 from typing import Final
 from typing import Union
@@ -42,8 +44,8 @@ from fmpy.util import fmu_info
 from gemseo.core.discipline.discipline import Discipline
 from gemseo.utils.constants import READ_ONLY_EMPTY_DICT
 from gemseo.utils.pydantic_ndarray import NDArrayPydantic
-from numpy import append
 from numpy import array
+from numpy import concatenate
 from numpy import ndarray
 from strenum import StrEnum
 
@@ -52,11 +54,13 @@ from gemseo_fmu.utils.time_manager import TimeManager
 from gemseo_fmu.utils.time_series import TimeSeries
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Iterable
     from collections.abc import Mapping
 
     from fmpy.model_description import DefaultExperiment
     from fmpy.model_description import ModelDescription
+    from fmpy.model_description import ScalarVariable
     from fmpy.simulation import Recorder
     from gemseo.core.discipline_data import DisciplineData
     from gemseo.typing import NumberArray
@@ -67,9 +71,130 @@ if TYPE_CHECKING:
 
 FMUModel = Union[FMU1Model, FMU2Model, FMU3Model, FMU1Slave, FMU2Slave, FMU3Slave]
 
+_InputType = Union[int, float, NDArrayPydantic, TimeSeries]
+"""The type of a discipline input."""
+
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _read_model_description(
+    file_path: Path, modification_time: float
+) -> ModelDescription:
+    """Read the description of an FMU model from its file.
+
+    The descriptions are cached,
+    so that the disciplines wrapping the same FMU file share the same description.
+
+    Args:
+        file_path: The absolute path to the FMU model file.
+        modification_time: The time of the last modification of the FMU model file,
+            so that a modified FMU model file is read again.
+
+    Returns:
+        The description of the FMU model.
+    """
+    return read_model_description(str(file_path))
+
+
+@lru_cache(maxsize=32)
+def _get_variables(model_description: ModelDescription) -> dict[str, ScalarVariable]:
+    """Return the variables of an FMU model.
+
+    The variables are cached,
+    so that the disciplines sharing the same description share them too.
+
+    Args:
+        model_description: The description of the FMU model.
+
+    Returns:
+        The FMU variables bound to their names.
+    """
+    return {variable.name: variable for variable in model_description.modelVariables}
+
+
+_MODEL_DIR_PATHS: dict[tuple[Path, float], Path] = {}
+"""The directories of the extracted FMU model files bound to their paths and times."""
+
+_MODEL_DIR_PATH_COUNTER: Counter[Path] = Counter()
+"""The numbers of disciplines using the directories of the extracted FMU model files."""
+
+_MODEL_DIR_PATHS_LOCK: Final[RLock] = RLock()
+"""The lock to access the directories of the extracted FMU model files.
+
+This lock is reentrant
+as a garbage collection triggered by an allocation while holding it
+can delete a discipline releasing its directory in the same thread.
+"""
+
+
+def _acquire_model_dir_path(file_path: Path) -> Path:
+    """Return the directory of an FMU model file extracted once per process.
+
+    Args:
+        file_path: The absolute path to the FMU model file.
+
+    Returns:
+        The directory containing the files extracted from the FMU model file.
+    """
+    key = (file_path, file_path.stat().st_mtime)
+    with _MODEL_DIR_PATHS_LOCK:
+        model_dir_path = _MODEL_DIR_PATHS.get(key)
+        if model_dir_path is not None:
+            # The directory is counted before any allocation
+            # so that it cannot be released in the meantime.
+            _MODEL_DIR_PATH_COUNTER[model_dir_path] += 1
+
+    if model_dir_path is not None:
+        if model_dir_path.is_dir():
+            return model_dir_path
+
+        # The directory has been deleted by another means.
+        with _MODEL_DIR_PATHS_LOCK:
+            if _MODEL_DIR_PATHS.get(key) == model_dir_path:
+                del _MODEL_DIR_PATHS[key]
+
+        _release_model_dir_path(model_dir_path)
+
+    # The FMU model file is extracted without holding the lock.
+    new_model_dir_path = Path(extract(str(file_path))).resolve()
+    with _MODEL_DIR_PATHS_LOCK:
+        model_dir_path = _MODEL_DIR_PATHS.setdefault(key, new_model_dir_path)
+        _MODEL_DIR_PATH_COUNTER[model_dir_path] += 1
+
+    if model_dir_path != new_model_dir_path:
+        # Another thread has extracted the FMU model file in the meantime.
+        rmtree(new_model_dir_path, ignore_errors=True)
+
+    return model_dir_path
+
+
+def _release_model_dir_path(model_dir_path: Path) -> bool:
+    """Release the directory of an extracted FMU model file.
+
+    Args:
+        model_dir_path: The directory of the extracted FMU model file.
+
+    Returns:
+        Whether the directory is no longer used by any discipline of this process;
+        `False` when the directory has not been extracted by this process.
+    """
+    with _MODEL_DIR_PATHS_LOCK:
+        if model_dir_path not in _MODEL_DIR_PATH_COUNTER:
+            return False
+
+        _MODEL_DIR_PATH_COUNTER[model_dir_path] -= 1
+        if _MODEL_DIR_PATH_COUNTER[model_dir_path]:
+            return False
+
+        del _MODEL_DIR_PATH_COUNTER[model_dir_path]
+        for key, path in tuple(_MODEL_DIR_PATHS.items()):
+            if path == model_dir_path:
+                _MODEL_DIR_PATHS.pop(key, None)
+
+        return True
+
+
 class BaseFMUDiscipline(Discipline):
     """A base discipline wrapping a Functional Mockup Unit (FMU) model.
 
@@ -110,6 +235,9 @@ class BaseFMUDiscipline(Discipline):
     _initial_values: dict[str, NumberArray]
     """The initial values of the discipline outputs."""
 
+    __can_get_and_set_model_state: bool
+    """Whether the FMU model can get and set its state."""
+
     __causalities_to_variable_names: dict[str, list[str]]
     """The names of the variables sorted by causality."""
 
@@ -135,6 +263,12 @@ class BaseFMUDiscipline(Discipline):
     __from_fmu_names: dict[str, str]
     """The map from the FMU variable names to the discipline variable names."""
 
+    __initial_model_state: Any
+    """The state of the FMU model just after its initialization, if any."""
+
+    __initialize_model_once: bool
+    """Whether the FMU model is initialized only at the first static execution."""
+
     __model: FMUModel
     """The FMU model."""
 
@@ -144,9 +278,18 @@ class BaseFMUDiscipline(Discipline):
     __model_dir_path: Path
     """The description of the FMU model, read from the XML file in the archive."""
 
+    __model_dir_path_is_shared: bool
+    """Whether the directory of the FMU instance is shared by several disciplines."""
+
     __model_fmi_version: str
     """The FMI version of the FMU model."""
 
+    __model_info: str
+    """The information about the FMU model; empty until the first representation."""
+
+    __model_is_initialized: bool
+    """Whether the FMU model has been initialized."""
+
     __model_name: str
     """The name of the FMU model."""
 
@@ -168,6 +311,14 @@ class BaseFMUDiscipline(Discipline):
     __time: RealArray | None
     """The time steps of the last execution; `None` when not yet executed."""
 
+    __time_functions_to_evaluate: list[
+        tuple[Callable[[TimeDurationType], float], int, list[float]]
+    ]
+    """The time functions with their value references and values.
+
+    These items are evaluated at the end of the time steps of the current simulation.
+    """
+
     __time_manager: TimeManager
     """The time manager."""
 
@@ -194,6 +345,7 @@ class BaseFMUDiscipline(Discipline):
         model_instance_directory: str | Path = "",
         delete_model_instance_directory: bool = True,
         variable_names: Mapping[str, str] = READ_ONLY_EMPTY_DICT,
+        initialize_model_once: bool = False,
         **pre_instantiation_parameters: Any,
     ) -> None:
         """
@@ -231,22 +383,40 @@ class BaseFMUDiscipline(Discipline):
             solver_name: The name of the solver to simulate a model-exchange model.
             model_instance_directory: The directory of the FMU instance,
                 containing the files extracted from the FMU model file;
-                if empty, let `fmpy` create a temporary directory.
+                if empty, use a temporary directory
+                shared by the disciplines wrapping the same FMU model file.
             delete_model_instance_directory: Whether to delete the directory
                 of the FMU instance when deleting the discipline.
+                A shared directory is deleted
+                only when deleting the last discipline using it.
             variable_names: The names of the discipline inputs and outputs
                 associated with the names of the FMU model inputs and outputs,
                 passed as `{fmu_model_variable_name: discipline_variable_name, ...}`.
                 When missing, use the names of the FMU model inputs and outputs.
+            initialize_model_once: Whether an FMU model
+                without continuous states and event indicators
+                is initialized only at the first execution
+                when simulated without time stepping.
+                This assumes that the FMU model has no internal state,
+                e.g. discrete or clocked,
+                carried over from one execution to the next.
+                Otherwise, initialize the FMU model at each execution.
             **pre_instantiation_parameters: The parameters to be passed
                 to `_pre_instantiate()`.
         """  # noqa: D205 D212 D415
         self.__delete_model_instance_directory = delete_model_instance_directory
         self.__executed = False
+        self.__model_info = ""
         self.__names_to_time_functions = {}
+        self.__time_functions_to_evaluate = []
         self.__solver_name = str(solver_name)
         self.name = self.__set_fmu_model(
-            file_path, model_instance_directory, do_step, use_co_simulation, name
+            file_path,
+            model_instance_directory,
+            do_step,
+            use_co_simulation,
+            name,
+            initialize_model_once,
         )
         self.__from_fmu_names = dict(variable_names)
         self.__to_fmu_names = {v: k for k, v in variable_names.items()}
@@ -261,9 +431,7 @@ class BaseFMUDiscipline(Discipline):
         self._pre_instantiate(**(pre_instantiation_parameters or {}))
         super().__init__(name=self.name)
 
-        self.input_grammar.update_from_types(
-            dict.fromkeys(input_names, Union[int, float, NDArrayPydantic, TimeSeries])
-        )
+        self.input_grammar.update_from_types(dict.fromkeys(input_names, _InputType))
         self.output_grammar.update_from_names(output_names)
         if add_time_to_output_grammar:
             self.output_grammar.update_from_types({
@@ -382,6 +550,7 @@ class BaseFMUDiscipline(Discipline):
         do_step: bool,
         use_co_simulation: bool,
         name: str,
+        initialize_model_once: bool,
     ) -> str:
         """Read the FMU model.
 
@@ -389,7 +558,8 @@ class BaseFMUDiscipline(Discipline):
             file_path: The path to the FMU model file.
             model_instance_directory: The directory of the FMU instance,
                 containing the files extracted from the FMU model file;
-                if empty, let `fmpy` create a temporary directory.
+                if empty, use a temporary directory
+                shared by the disciplines wrapping the same FMU model file.
             do_step: Whether the model is simulated over only one `time_step`
                 when calling
                 [execute()][gemseo_fmu.disciplines.fmu_discipline.FMUDiscipline.execute].
@@ -399,6 +569,9 @@ class BaseFMUDiscipline(Discipline):
                 When `do_step` is `True`, the co-simulation FMI type is required.
             name: The default name of the discipline.
                 If empty, deduce it from the FMU file.
+            initialize_model_once: Whether an FMU model
+                without continuous states and event indicators
+                is initialized only at the first static execution.
 
         Returns:
             The name of the discipline.
@@ -406,13 +579,11 @@ class BaseFMUDiscipline(Discipline):
         # The path to the FMU file, which is a ZIP archive.
         self.__file_path = Path(file_path)
 
-        # The path to unzipped archive.
-        self.__model_dir_path = Path(
-            extract(str(file_path), unzipdir=model_instance_directory or None)
-        ).resolve()
-
         # The description of the FMU model, read from the XML file in the archive.
-        self.__model_description = read_model_description(str(self.__model_dir_path))
+        file_path = self.__file_path.resolve()
+        self.__model_description = _read_model_description(
+            file_path, file_path.stat().st_mtime
+        )
         self.__model_name = self.__model_description.modelName
         self.__model_fmi_version = self.__model_description.fmiVersion
         self.__use_fmi_3 = self.__model_fmi_version == "3.0"
@@ -430,22 +601,63 @@ class BaseFMUDiscipline(Discipline):
             )
             self.__model_type = self._CO_SIMULATION
 
+        if self.__model_type == self._CO_SIMULATION:
+            implementation = self.__model_description.coSimulation
+        else:
+            implementation = self.__model_description.modelExchange
+
+        # The path to unzipped archive,
+        # shared by the disciplines wrapping the same FMU file
+        # unless its shared library can be instantiated only once per process.
+        self.__model_dir_path_is_shared = not (
+            model_instance_directory
+            or (
+                implementation is not None
+                and implementation.canBeInstantiatedOnlyOncePerProcess
+            )
+        )
+        if not self.__model_dir_path_is_shared:
+            self.__model_dir_path = Path(
+                extract(str(file_path), unzipdir=model_instance_directory or None)
+            ).resolve()
+        else:
+            self.__model_dir_path = _acquire_model_dir_path(file_path)
+
         # Instantiation of the FMU model.
-        self.__model = instantiate_fmu(
-            self.__model_dir_path,
-            self.__model_description,
-            fmi_type=self.__model_type,
+        try:
+            self.__model = instantiate_fmu(
+                self.__model_dir_path,
+                self.__model_description,
+                fmi_type=self.__model_type,
+            )
+        except Exception:
+            self.__release_model_dir_path()
+            # The directory must not be released again when deleting the discipline.
+            self.__model_dir_path_is_shared = False
+            self.__delete_model_instance_directory = False
+            raise
+
+        self.__can_get_and_set_model_state = (
+            self.__model_fmi_version != "1.0"
+            and implementation is not None
+            and implementation.canGetAndSetFMUstate
         )
+        self.__initial_model_state = None
+        self.__initialize_model_once = initialize_model_once and not (
+            self.__model_description.numberOfContinuousStates
+            or self.__model_description.numberOfEventIndicators
+        )
+        self.__model_is_initialized = False
         self.__parameter_setter_name = "setFloat64" if self.__use_fmi_3 else "setReal"
         return name
 
     def __set_initial_values(self) -> None:
         """Set the initial values of the inputs and outputs of the disciplines."""
         self._initial_values = {}
-        from_fmu_names = self.__from_fmu_names
-        for variable in self.__model_description.modelVariables:
-            variable_name = from_fmu_names.get(variable.name)
-            if variable_name is not None:
+        variables = _get_variables(self.__model_description)
+        for fmu_variable_name, variable_name in self.__from_fmu_names.items():
+            variable = variables.get(fmu_variable_name)
+            if variable is not None:
                 try:
                     initial_value = float(variable.start)
                 except TypeError:
@@ -524,11 +736,11 @@ class BaseFMUDiscipline(Discipline):
         )
 
         # The reference values bound to the variable names.
+        variables = _get_variables(self.__model_description)
         self.__names_to_references = {
-            from_fmu_names[variable_name]: variable.valueReference
-            for variable in self.__model_description.modelVariables
-            if (variable_name := variable.name) in fmu_input_names
-            or variable_name in self.__fmu_output_names
+            from_fmu_names[variable_name]: variables[variable_name].valueReference
+            for variable_name in (*fmu_input_names, *self.__fmu_output_names)
+            if variable_name in variables
         }
 
         return discipline_input_names, discipline_output_names
@@ -576,11 +788,12 @@ class BaseFMUDiscipline(Discipline):
         return self.__causalities_to_variable_names
 
     def __repr__(self) -> str:
-        return (
-            super().__repr__()
-            + "\n"
-            + fmu_info(self.__file_path, [c.value for c in self._Causality])
-        )
+        if not self.__model_info:
+            self.__model_info = fmu_info(
+                self.__file_path, [c.value for c in self._Causality]
+            )
+
+        return super().__repr__() + "\n" + self.__model_info
 
     def _pre_instantiate(self, **kwargs: Any) -> None:
         """Some actions to be done just before calling `MDODiscipline.__init__`.
@@ -597,26 +810,20 @@ class BaseFMUDiscipline(Discipline):
     ) -> DisciplineData:
         self.__executed = True
         full_input_data = self.io.prepare_input_data(input_data)
-        self.__names_to_time_functions = {
-            name: value.compute
-            for name, value in full_input_data.items()
-            if isinstance(value, TimeSeries)
-        }
-        self.__names_to_time_functions.update({
-            name: value
-            for name, value in full_input_data.items()
-            if isinstance(value, Callable)
-        })
-        full_input_data.update({
-            name: array([value.observable[0]])
-            for name, value in full_input_data.items()
-            if isinstance(value, TimeSeries)
-        })
-        full_input_data.update({
-            name: array([value(self.__time_manager.current)])
-            for name, value in full_input_data.items()
-            if isinstance(value, Callable)
-        })
+        names_to_time_functions = self.__names_to_time_functions = {}
+        initial_input_data = {}
+        for name, value in full_input_data.items():
+            if isinstance(value, ndarray):
+                continue
+
+            if isinstance(value, TimeSeries):
+                names_to_time_functions[name] = value.compute
+                initial_input_data[name] = array([value.observable[0]])
+            elif callable(value):
+                names_to_time_functions[name] = value
+                initial_input_data[name] = array([value(self.__time_manager.current)])
+
+        full_input_data.update(initial_input_data)
         return super().execute(full_input_data)
 
     def set_default_execution(
@@ -705,25 +912,21 @@ class BaseFMUDiscipline(Discipline):
         if self.__simulation_settings[self._RESTART]:
             self.__time_manager.reset()
 
-        if self.__time_manager.is_initial:
-            self.__model.reset()
-            if self.__use_fmi_3:
-                self.__model.enterInitializationMode(
-                    tolerance=self.__get_field_value(
-                        self.__model_description.defaultExperiment, "tolerance", None
-                    ),
-                    startTime=self.__time_manager.current,
-                )
+        # An algebraic model simulated without time stepping
+        # does not need to be initialized again
+        # when the user guarantees that it has no internal state.
+        is_static_execution = (
+            self.__do_step and self.__simulation_settings[self._TIME_STEP] == 0.0
+        )
+        if self.__time_manager.is_initial and not (
+            is_static_execution
+            and self.__initialize_model_once
+            and self.__model_is_initialized
+        ):
+            if self.__initial_model_state is None:
+                self.__initialize_model()
             else:
-                self.__model.setupExperiment(
-                    tolerance=self.__get_field_value(
-                        self.__model_description.defaultExperiment, "tolerance", None
-                    ),
-                    startTime=self.__time_manager.current,
-                )
-                self.__model.enterInitializationMode()
-
-            self.__model.exitInitializationMode()
+                self.__model.setFMUState(self.__initial_model_state)
 
         if not self.__time_manager.is_initial and self.__time_manager.is_final:
             msg = (
@@ -738,11 +941,53 @@ class BaseFMUDiscipline(Discipline):
         simulate(input_data)
         self.__simulation_settings = {}
 
+    def __initialize_model(self) -> None:
+        """Reset and initialize the FMU model at initial time.
+
+        When the FMU model can get and set its state,
+        the state after initialization is stored
+        to restore it at the next initialization
+        instead of resetting and initializing the FMU model again.
+        """
+        self.__model.reset()
+        if self.__use_fmi_3:
+            self.__model.enterInitializationMode(
+                tolerance=self.__get_field_value(
+                    self.__model_description.defaultExperiment, "tolerance", None
+                ),
+                startTime=self.__time_manager.current,
+            )
+        else:
+            self.__model.setupExperiment(
+                tolerance=self.__get_field_value(
+                    self.__model_description.defaultExperiment, "tolerance", None
+                ),
+                startTime=self.__time_manager.current,
+            )
+            self.__model.enterInitializationMode()
+
+        self.__model.exitInitializationMode()
+        self.__model_is_initialized = True
+        if self.__can_get_and_set_model_state:
+            self.__initial_model_state = self.__model.getFMUState()
+
     def __del__(self) -> None:
+        if self.__initial_model_state is not None:
+            self.__model.freeFMUState(self.__initial_model_state)
+
         if self.__executed:
             self.__model.terminate()
         self.__model.freeInstance()
-        if self.__delete_model_instance_directory:
+        self.__release_model_dir_path()
+
+    def __release_model_dir_path(self) -> None:
+        """Release the directory of the FMU instance and delete it if unused."""
+        if self.__model_dir_path_is_shared:
+            is_unused = _release_model_dir_path(self.__model_dir_path)
+        else:
+            is_unused = True
+
+        if is_unused and self.__delete_model_instance_directory:
             rmtree(self.__model_dir_path, ignore_errors=True)
 
     def __run_one_step(self, input_data: Mapping[str, NumberArray]) -> None:
@@ -765,6 +1010,13 @@ class BaseFMUDiscipline(Discipline):
             step = self.__simulation_settings[self._SIMULATION_TIME] or time_step
             time_manager = self.__time_manager.update_current_time(step)
             time_manager.step = time_step
+            # After the first time step,
+            # only the inputs defined as time functions have to be set again.
+            time_function_input_data = {
+                name: value
+                for name, value in input_data.items()
+                if name in self.__names_to_time_functions
+            }
             while True:
                 try:
                     current_time = time_manager.current
@@ -773,20 +1025,29 @@ class BaseFMUDiscipline(Discipline):
                     break
 
                 self.__set_model_inputs(input_data, time_manager.current, True)
+                input_data = time_function_input_data
                 self.__model.doStep(
                     currentCommunicationPoint=current_time,
                     communicationStepSize=time_step,
                 )
 
         self._time = array([time_manager.final])
-        output_data = {}
-        for output_name in self.io.output_grammar.names_without_namespace:
-            if output_name == self._TIME:
-                output_data[self._TIME] = self._time
-            else:
-                output_data[output_name] = array(
-                    self.__model.getReal([self.__names_to_references[output_name]])
-                )
+        output_names = list(self.io.output_grammar.names_without_namespace)
+        has_time = self._TIME in output_names
+        if has_time:
+            output_names.remove(self._TIME)
+
+        names_to_references = self.__names_to_references
+        output_values = self.__model.getReal([
+            names_to_references[output_name] for output_name in output_names
+        ])
+        output_data = {
+            output_name: array([output_value])
+            for output_name, output_value in zip(output_names, output_values)
+        }
+        if has_time:
+            output_data[self._TIME] = self._time
+
         self.io.update_output_data(output_data)
 
     def __set_model_inputs(
@@ -798,6 +1059,8 @@ class BaseFMUDiscipline(Discipline):
             input_data: The input values.
             time: The evaluation time.
         """
+        references = []
+        values = []
         for input_name, input_value in input_data.items():
             if input_name in self.__names_to_time_functions:
                 try:
@@ -812,9 +1075,11 @@ class BaseFMUDiscipline(Discipline):
             else:
                 value = input_value
 
-            getattr(self.__model, self.__parameter_setter_name)(
-                [self.__names_to_references[input_name]], [value]
-            )
+            references.append(self.__names_to_references[input_name])
+            values.append(value)
+
+        if references:
+            getattr(self.__model, self.__parameter_setter_name)(references, values)
 
     def __do_when_step_finished(self, time: float, recorder: Recorder) -> bool:
         """Callback to interact with the simulation after each time step.
@@ -825,17 +1090,20 @@ class BaseFMUDiscipline(Discipline):
             time: The current time.
             recorder: A helper to record the variables during the simulation.
         """
-        fmu = recorder.fmu
-        for name, function in self.__names_to_time_functions.items():
+        references = []
+        values = []
+        for function, reference, history in self.__time_functions_to_evaluate:
             try:
                 value = function(time)
             except ValueError:
                 continue
 
-            getattr(fmu, self.__parameter_setter_name)(
-                [self.__names_to_references[name]], [value]
-            )
-            self.io.data[name] = append(self.io.data[name], value)
+            references.append(reference)
+            values.append(value)
+            history.append(value)
+
+        if references:
+            getattr(recorder.fmu, self.__parameter_setter_name)(references, values)
 
         return True
 
@@ -849,6 +1117,18 @@ class BaseFMUDiscipline(Discipline):
         time_manager = self.__time_manager.update_current_time(simulation_time)
         time_step = self.__simulation_settings[self._TIME_STEP]
         self.__set_model_inputs(input_data, time_manager.initial, False)
+        # The values of the time functions computed at the end of the time steps.
+        names_to_time_function_values = {
+            name: [] for name in self.__names_to_time_functions
+        }
+        self.__time_functions_to_evaluate = [
+            (
+                function,
+                self.__names_to_references[name],
+                names_to_time_function_values[name],
+            )
+            for name, function in self.__names_to_time_functions.items()
+        ]
         result = simulate_fmu(
             self.__model_dir_path,
             start_time=time_manager.initial,
@@ -860,10 +1140,17 @@ class BaseFMUDiscipline(Discipline):
             output=self.__fmu_output_names,
             fmu_instance=self.__model,
             model_description=self.__model_description,
-            step_finished=self.__do_when_step_finished,
+            # The callback is only needed to update the time-function inputs.
+            step_finished=self.__do_when_step_finished
+            if self.__names_to_time_functions
+            else None,
             initialize=False,
             terminate=False,
         )
+        io_data = self.io.data
+        for name, values in names_to_time_function_values.items():
+            io_data[name] = concatenate((io_data[name], values))
+
         self._time = result[self._TIME]
         output_data = {
             name: array(result[self.__to_fmu_names[name]])
@@ -873,12 +1160,25 @@ class BaseFMUDiscipline(Discipline):
 
     def __setstate__(self, state: Mapping[str, Any]) -> None:
         super().__setstate__(state)
+        # The copy of a discipline uses the same directory as the original one.
+        if self.__model_dir_path_is_shared:
+            with _MODEL_DIR_PATHS_LOCK:
+                if self.__model_dir_path in _MODEL_DIR_PATH_COUNTER:
+                    _MODEL_DIR_PATH_COUNTER[self.__model_dir_path] += 1
+                else:
+                    # This directory has been extracted by another process,
+                    # which is in charge of deleting it.
+                    self.__delete_model_instance_directory = False
+
         self.__model = instantiate_fmu(
             self.__model_dir_path,
             self.__model_description,
             fmi_type=self.__model_type,
         )
+        self.__initial_model_state = None
+        self.__model_is_initialized = False
 
     _ATTR_NOT_TO_SERIALIZE = Discipline._ATTR_NOT_TO_SERIALIZE.union([
-        "_BaseFMUDiscipline__model"
+        "_BaseFMUDiscipline__initial_model_state",
+        "_BaseFMUDiscipline__model",
     ])
@@ -51,14 +51,10 @@ class DoStepFMUDiscipline(FMUDiscipline):
         variable_names: Mapping[str, str] = READ_ONLY_EMPTY_DICT,
         **pre_instantiation_parameters: Any,
     ) -> None:
-        do_step = pre_instantiation_parameters.get(self._DO_STEP, None)
-        if do_step is False:
+        if pre_instantiation_parameters.pop(self._DO_STEP, None) is False:
             msg = "DoStepFMUDiscipline has no do_step parameter."
             raise ValueError(msg)
 
-        if do_step is True:
-            del pre_instantiation_parameters[self._DO_STEP]
-
         super().__init__(
             file_path,
             input_names=input_names,
@@ -20,6 +20,8 @@ from typing import TYPE_CHECKING
 
 from gemseo.datasets.dataset import Dataset
 from gemseo.post.dataset.lines import Lines
+from numpy import interp
+from numpy import ndim
 from numpy import newaxis
 
 from gemseo_fmu.disciplines.base_fmu_discipline import BaseFMUDiscipline
@@ -33,6 +35,8 @@ if TYPE_CHECKING:
     from gemseo.typing import NumberArray
     from gemseo.typing import RealArray
 
+    from gemseo_fmu.utils.time_duration import TimeDurationType
+
 
 class FMUDiscipline(BaseFMUDiscipline):
     """A dynamic discipline wrapping a Functional Mockup Unit (FMU) model.
@@ -113,3 +117,44 @@ class FMUDiscipline(BaseFMUDiscipline):
         figure = Lines(dataset, output_names, abscissa_variable=abscissa_name)
         figure.execute(save=save, show=show, file_path=file_path)
         return figure
+
+    def interpolate(
+        self,
+        time: TimeDurationType | Iterable[TimeDurationType],
+        output_names: str | Iterable[str] = (),
+    ) -> dict[str, RealArray]:
+        """Interpolate linearly the time evolution of output variables.
+
+        This method uses the result of the last execution
+        and does not simulate the FMU model again.
+
+        Args:
+            time: The time value(s) at which to interpolate the output variables;
+                either numbers in seconds or strings of characters
+                (see [TimeDuration][gemseo_fmu.utils.time_duration.TimeDuration]).
+            output_names: The name(s) of the output variable(s).
+                If empty, use all the output variables except the time.
+
+        Returns:
+            The values of the output variables at the time values.
+
+        Raises:
+            ValueError: When the discipline has not been executed yet.
+        """
+        if self.time is None:
+            msg = "The discipline must be executed before interpolating."
+            raise ValueError(msg)
+
+        output_data = self.get_output_data(with_namespaces=False)
+        if isinstance(output_names, str):
+            output_names = [output_names]
+        elif not output_names:
+            output_names = [name for name in output_data if name != self._TIME]
+
+        if isinstance(time, str) or ndim(time) == 0:
+            time = [time]
+
+        time = [TimeDuration(time_value).seconds for time_value in time]
+        return {
+            name: interp(time, self.time, output_data[name]) for name in output_names
+        }
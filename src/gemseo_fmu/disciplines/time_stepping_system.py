@@ -16,7 +16,6 @@
 
 from __future__ import annotations
 
-from copy import copy
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -218,20 +217,28 @@ class TimeSteppingSystem(Discipline):
 
     def __simulate_to_final_time(self, input_data: Mapping[str, Any]) -> None:
         """Simulate the multidisciplinary system until final time."""
-        local_data_history = []
+        # The values of the variables at the different time steps, indexed by name.
+        # Given a variable,
+        # we suppose that its value type is the same at all time steps.
+        names_to_histories = {}
+        inner_mda_caches = [inner_mda.cache for inner_mda in self.__mda.inner_mdas]
         while self.__time_manager.remaining > 0:
             self.__simulate_one_time_step(input_data)
-            local_data_history.append(copy(self.__mda.io.data))
             input_data = self.__mda.io.data
-            for inner_mda in self.__mda.inner_mdas:
-                inner_mda.cache.clear()
+            if not names_to_histories:
+                names_to_histories = {
+                    name: []
+                    for name, value in input_data.items()
+                    if not isinstance(value, TimeSeries)
+                }
+
+            for name, history in names_to_histories.items():
+                history.append(input_data[name])
+
+            for inner_mda_cache in inner_mda_caches:
+                inner_mda_cache.clear()
 
         # The different time steps are concatenated when the values are NumPy arrays.
-        # Given a variable,
-        # We suppose that it value type is the same at all time steps.
-        local_data_history_0 = local_data_history[0]
         self.io.update_output_data({
-            name: concatenate([local_data[name] for local_data in local_data_history])
-            for name in local_data_history_0
-            if not isinstance(local_data_history_0[name], TimeSeries)
+            name: concatenate(history) for name, history in names_to_histories.items()
         })
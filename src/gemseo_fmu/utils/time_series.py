@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections.abc import Sequence
 from dataclasses import field
 from typing import Callable
@@ -93,11 +94,9 @@ class TimeSeries:
             msg = f"The time series starts at {self.time[0]}; got {time}."
             raise ValueError(msg)
 
-        for time_i, observable_i in zip(self.time[1:], self.observable[:-1]):
-            if time + self.tolerance < time_i:
-                return observable_i
-
-        return self.observable[-1]
+        # The index of the last time value lower than or equal to the input value.
+        index = bisect_right(self.time, time + self.tolerance) - 1
+        return self.observable[index]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TimeSeries):
@@ -16,8 +16,11 @@
 
 from __future__ import annotations
 
+import gc
 import logging
 import re
+from pathlib import Path
+from shutil import copy
 from typing import Any
 from typing import NamedTuple
 from unittest import mock
@@ -30,6 +33,8 @@ from gemseo import to_pickle
 from gemseo.utils.comparisons import compare_dict_of_arrays
 from gemseo.utils.testing.helpers import image_comparison
 from numpy import array
+from numpy import float32
+from numpy import int64
 from numpy import ones
 from numpy import zeros
 from numpy.testing import assert_almost_equal
@@ -210,6 +215,18 @@ def test_repr(ramp_discipline):
     )
 
 
+def test_repr_model_info_computed_once():
+    """Check that the information about the FMU model is computed only once."""
+    discipline = FMUDiscipline(FMU_PATH)
+    with mock.patch.object(
+        base_fmu_discipline, "fmu_info", return_value="Model Info"
+    ) as fmu_info:
+        assert repr(discipline).endswith("\nModel Info")
+        assert repr(discipline).endswith("\nModel Info")
+
+    fmu_info.assert_called_once()
+
+
 def test_default_inputs(ramp_discipline):
     """Check the default inputs of the discipline."""
     default_inputs = ramp_discipline.default_input_data
@@ -822,3 +839,117 @@ def test_variable_names_exception():
         ValueError, match=re.escape("{'a'} are not FMU variable names.")
     ):
         FMUDiscipline(FMU_PATH, variable_names={"a": "x"})
+
+
+def test_shared_model_description():
+    """Check that the disciplines wrapping the same FMU file share its description."""
+    discipline = FMUDiscipline(FMU_PATH)
+    other_discipline = StaticFMUDiscipline(FMU_PATH)
+    assert discipline.model_description is other_discipline.model_description
+
+
+def test_do_step_sets_constant_inputs_once():
+    """Check that the constant inputs are set at the first time step only."""
+    discipline = FMUDiscipline(
+        FMU_PATH,
+        [INPUT_NAME],
+        [OUTPUT_NAME],
+        final_time=0.6,
+        time_step=0.2,
+        do_step=True,
+    )
+    discipline.set_next_execution(simulation_time=0.6)
+    model = discipline.model
+    with (
+        mock.patch.object(model, "setReal", wraps=model.setReal) as set_real,
+        mock.patch.object(model, "doStep", wraps=model.doStep) as do_step,
+    ):
+        discipline.execute({INPUT_NAME: array([2.0])})
+
+    assert do_step.call_count == 3
+    set_real.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("input_value", "has_callback"),
+    [(array([2.0]), False), (TimeSeries([0.0, 0.3], [2.0, 3.0]), True)],
+)
+def test_step_finished_callback(input_value, has_callback):
+    """Check that the step-finished callback is used only with time functions."""
+    discipline = FMUDiscipline(
+        FMU_PATH, [INPUT_NAME], [OUTPUT_NAME], final_time=0.6, time_step=0.2
+    )
+    with mock.patch.object(
+        base_fmu_discipline, "simulate_fmu", wraps=base_fmu_discipline.simulate_fmu
+    ) as simulate_fmu:
+        discipline.execute({INPUT_NAME: input_value})
+
+    assert (simulate_fmu.call_args.kwargs["step_finished"] is not None) is has_callback
+
+
+def test_shared_model_instance_directory(tmp_path):
+    """Check that the disciplines wrapping the same FMU file share its directory."""
+    # The FMU file is copied so that no other discipline uses this directory.
+    file_path = copy(FMU_PATH, tmp_path)
+    discipline = FMUDiscipline(file_path)
+    other_discipline = StaticFMUDiscipline(file_path)
+    directory = discipline._BaseFMUDiscipline__model_dir_path
+    assert other_discipline._BaseFMUDiscipline__model_dir_path == directory
+    to_pickle(other_discipline, tmp_path / "discipline.pkl")
+    copied_discipline = from_pickle(tmp_path / "discipline.pkl")
+    assert copied_discipline._BaseFMUDiscipline__model_dir_path == directory
+    del discipline
+    del other_discipline
+    gc.collect()
+    assert directory.is_dir()
+    del copied_discipline
+    gc.collect()
+    assert not directory.exists()
+
+
+def test_release_model_instance_directory_on_instantiation_error(tmp_path):
+    """Check that the directory is released when the FMU model instantiation fails."""
+    file_path = Path(copy(FMU_PATH, tmp_path)).resolve()
+    counter = dict(base_fmu_discipline._MODEL_DIR_PATH_COUNTER)
+    with (
+        mock.patch.object(
+            base_fmu_discipline, "instantiate_fmu", side_effect=RuntimeError
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        FMUDiscipline(file_path)
+
+    gc.collect()
+    assert dict(base_fmu_discipline._MODEL_DIR_PATH_COUNTER) == counter
+    assert all(key[0] != file_path for key in base_fmu_discipline._MODEL_DIR_PATHS)
+
+
+def test_release_unknown_model_instance_directory(tmp_path):
+    """Check that a directory not extracted by this process is not released."""
+    assert not base_fmu_discipline._release_model_dir_path(tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("time", "output_names", "expected"),
+    [
+        (0.1, (), {OUTPUT_NAME: array([0.2])}),
+        ([0.1, "0.3s"], OUTPUT_NAME, {OUTPUT_NAME: array([0.2, 0.6])}),
+        ([0.1, 0.5], [OUTPUT_NAME], {OUTPUT_NAME: array([0.2, 1.0])}),
+        (int64(0), (), {OUTPUT_NAME: array([0.0])}),
+        (float32(0.5), (), {OUTPUT_NAME: array([1.0])}),
+    ],
+)
+def test_interpolate(ramp_discipline_w_restart, time, output_names, expected):
+    """Check the interpolation of the outputs of the last execution."""
+    ramp_discipline_w_restart.execute()
+    assert compare_dict_of_arrays(
+        ramp_discipline_w_restart.interpolate(time, output_names), expected, 1e-12
+    )
+
+
+def test_interpolate_before_execution():
+    """Check that interpolating before executing raises an error."""
+    discipline = FMUDiscipline(FMU_PATH, [INPUT_NAME], [OUTPUT_NAME], final_time=1.0)
+    msg = "The discipline must be executed before interpolating."
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        discipline.interpolate(0.1)
@@ -16,11 +16,15 @@
 
 from __future__ import annotations
 
+import gc
 from inspect import getfullargspec
+from unittest import mock
 
 import pytest
+from fmpy import read_model_description
 from numpy import array
 
+from gemseo_fmu.disciplines import base_fmu_discipline
 from gemseo_fmu.disciplines.static_fmu_discipline import StaticFMUDiscipline
 from gemseo_fmu.problems.fmu_files import get_fmu_file_path
 
@@ -73,3 +77,75 @@ def test_execution_add(add, input_data, set_default_inputs, result):
         add.default_input_data.update({"add.k1": array([1.0]), "u1": array([1.0])})
 
     assert add.execute(input_data)["y"] == result
+
+
+def test_batched_fmi_calls():
+    """Check that the inputs are set and the outputs are got with one FMI call."""
+    discipline = StaticFMUDiscipline(get_fmu_file_path("add"))
+    model = discipline.model
+    with (
+        mock.patch.object(model, "setReal", wraps=model.setReal) as set_real,
+        mock.patch.object(model, "getReal", wraps=model.getReal) as get_real,
+    ):
+        discipline.execute()
+
+    assert set_real.call_count == 1
+    assert len(set_real.call_args.args[0]) == 4
+    assert get_real.call_count == 1
+
+
+def test_restore_initial_model_state():
+    """Check that the initial state is restored instead of initializing the model."""
+    file_path = get_fmu_file_path("ramp")
+    model_description = read_model_description(str(file_path))
+    model_description.coSimulation.canGetAndSetFMUstate = True
+    with mock.patch.object(
+        base_fmu_discipline, "_read_model_description", return_value=model_description
+    ):
+        discipline = StaticFMUDiscipline(file_path)
+
+    model = discipline.model
+    state = mock.sentinel.state
+    with (
+        mock.patch.object(model, "reset", wraps=model.reset) as reset,
+        mock.patch.object(model, "getFMUState", return_value=state) as get_fmu_state,
+        mock.patch.object(model, "setFMUState") as set_fmu_state,
+        mock.patch.object(model, "freeFMUState") as free_fmu_state,
+    ):
+        discipline.execute()
+        get_fmu_state.assert_called_once_with()
+        set_fmu_state.assert_not_called()
+        discipline.execute({"ramp.height": array([2.0])})
+        reset.assert_called_once()
+        get_fmu_state.assert_called_once_with()
+        set_fmu_state.assert_called_once_with(state)
+        del discipline
+        gc.collect()
+        free_fmu_state.assert_called_once_with(state)
+
+
+@pytest.mark.parametrize(
+    ("initialize_model_once", "reset_call_count"), [(False, 4), (True, 1)]
+)
+def test_algebraic_model_initialization(initialize_model_once, reset_call_count):
+    """Check that an algebraic model is initialized only once on demand."""
+    discipline = StaticFMUDiscipline(
+        get_fmu_file_path("add"), initialize_model_once=initialize_model_once
+    )
+    model = discipline.model
+    with mock.patch.object(model, "reset", wraps=model.reset) as reset:
+        assert discipline.execute()["y"] == 0
+        assert discipline.execute({"u1": array([2.0]), "u2": array([3.0])})["y"] == 5
+        input_data = {"u1": array([2.0]), "u2": array([3.0]), "add.k1": array([4.0])}
+        assert discipline.execute(input_data)["y"] == 11
+        assert discipline.execute()["y"] == 0
+
+    assert reset.call_count == reset_call_count
+
+
+def test_non_algebraic_model():
+    """Check that a model with event indicators is initialized at each execution."""
+    discipline = StaticFMUDiscipline(
+        get_fmu_file_path("ramp"), initialize_model_once=True
+    )
+    assert not discipline._BaseFMUDiscipline__initialize_model_once
@@ -65,6 +65,24 @@ def test_compute(time, expected):
     assert time_series.compute(time) == expected
 
 
+@pytest.mark.parametrize(
+    ("time", "tolerance", "expected"),
+    [
+        (0.0, 0.0, 1),
+        (0.9, 0.0, 1),
+        (0.9, 0.1, 2),
+        (1.0, 0.0, 2),
+        (2.5, 0.0, 3),
+        (3.0, 0.0, 4),
+        (4.0, 0.0, 4),
+    ],
+)
+def test_compute_with_tolerance(time, tolerance, expected):
+    """Verify that TimeSeries.compute uses the tolerance."""
+    time_series = TimeSeries([0, 1, 2, 3], [1, 2, 3, 4], tolerance=tolerance)
+    assert time_series.compute(time) == expected
+
+
 def test_compute_string():
     """Verify that TimeSeries.compute works with string values."""
     time_series = TimeSeries([1, 2], [3, 4])